@@ -0,0 +1,153 @@
+"""
+Pattern scanning core for GrantScout RFP analysis.
+
+Holds no agent state and is fully annotated, so mypyc can compile it as
+is; nothing builds it yet, so GrantScout imports the plain module.
+"""
+import re
+from itertools import islice
+from typing import Collection, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+class RfpAnalysis(NamedTuple):
+    """Sections extracted from an RFP by GrantScout._analyze_document."""
+    requirements: List[str]
+    eligibility: List[str]
+    deadlines: List[str]
+    scoring_criteria: List[str]
+
+# Every pattern below is a literal prefix followed by a greedy negated class
+# with no nested quantifiers. Once the prefix matches, the tail cannot fail
+# after its first character, so sre never backtracks more than one step and
+# each scan is linear in the text length, even on adversarial input. Keep new
+# patterns in this shape.
+
+# Requirement patterns fused into one alternation so the text is scanned once.
+# All anchors share a single [^.]+ tail and nothing before it can also match
+# a tail character, so the engine never has to backtrack into the anchor.
+# The anchors are kept as a flat list of literals so sre can build a
+# first-character prefilter and skip positions that cannot start a match.
+REQ_ANCHORS: Tuple[str, ...] = ("applicants must ", "must ", "should ", "shall ", "required to ", "requirement")
+REQ_PATTERNS: Tuple["re.Pattern[str]", ...] = (
+    re.compile("(?:" + "|".join(map(re.escape, REQ_ANCHORS)) + r")[^\.]+"),
+)
+REQ_PATTERN_ANCHORS: Tuple[Tuple[str, ...], ...] = (REQ_ANCHORS,)
+
+# Look for eligibility information
+ELIG_PATTERNS: Tuple["re.Pattern[str]", ...] = tuple(re.compile(p) for p in (
+    r"eligibility:?\s*([^\.]+)",
+    r"eligible (?:organizations|applicants|entities)[\s:]+([^\.]+)",
+    r"who can apply:?\s*([^\.]+)"
+))
+ELIG_PATTERN_ANCHORS: Tuple[Tuple[str, ...], ...] = (("eligibility",), ("eligible ",), ("who can apply",))
+
+# Look for deadline information
+DEADLINE_PATTERNS: Tuple["re.Pattern[str]", ...] = tuple(re.compile(p) for p in (
+    r"deadline:?\s*([^\.\n]+)",
+    r"due (?:date|by):?\s*([^\.\n]+)",
+    r"submissions due:?\s*([^\.\n]+)"
+))
+DEADLINE_PATTERN_ANCHORS: Tuple[Tuple[str, ...], ...] = (("deadline",), ("due ",), ("submissions due",))
+
+# Look for scoring criteria
+SCORING_PATTERNS: Tuple["re.Pattern[str]", ...] = tuple(re.compile(p) for p in (
+    r"scoring criteria:?\s*([^\.]+)",
+    r"evaluation criteria:?\s*([^\.]+)",
+    r"(?:proposals|applications) will be (?:evaluated|judged|scored) (?:based on|according to):?\s*([^\.]+)"
+))
+SCORING_PATTERN_ANCHORS: Tuple[Tuple[str, ...], ...] = (("scoring criteria",), ("evaluation criteria",), (" will be ",))
+
+# Limit for demonstration
+REQ_LIMIT = 10
+ELIG_LIMIT = 5
+DEADLINE_LIMIT = 3
+SCORING_LIMIT = 5
+
+# Pattern group, literal anchors and limit for each RfpAnalysis field
+PatternGroup = Tuple[str, Tuple["re.Pattern[str]", ...], Tuple[Tuple[str, ...], ...], int]
+PATTERN_GROUPS: Tuple[PatternGroup, ...] = (
+    ("requirements", REQ_PATTERNS, REQ_PATTERN_ANCHORS, REQ_LIMIT),
+    ("eligibility", ELIG_PATTERNS, ELIG_PATTERN_ANCHORS, ELIG_LIMIT),
+    ("deadlines", DEADLINE_PATTERNS, DEADLINE_PATTERN_ANCHORS, DEADLINE_LIMIT),
+    ("scoring_criteria", SCORING_PATTERNS, SCORING_PATTERN_ANCHORS, SCORING_LIMIT)
+)
+
+def iter_segments(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Regroup streamed chunks so every segment (except the last) ends in a '.'.
+
+    None of the analysis patterns can match across a '.', so each segment can
+    be scanned on its own and the matches are the same as for the whole text.
+    """
+    pending: List[str] = []
+    for chunk in chunks:
+        cut = chunk.rfind('.') + 1
+        if cut:
+            pending.append(chunk[:cut])
+            yield ''.join(pending)
+            pending = [chunk[cut:]]
+        else:
+            pending.append(chunk)
+    tail = ''.join(pending)
+    if tail:
+        yield tail
+
+def analyze_chunks(chunks: Iterable[str], sections: Optional[Collection[str]] = None) -> RfpAnalysis:
+    """
+    Extract requirements, eligibility, deadlines, and scoring criteria from text chunks.
+
+    If `sections` is non-empty, only the RfpAnalysis fields it names are
+    extracted and the rest are left empty; None or an empty collection selects
+    every section.
+    """
+    # Sample identification of requirements (very basic regex patterns).
+    # All patterns are lowercase and compiled without IGNORECASE; matches are
+    # kept per pattern so the output order is the same as scanning the whole
+    # text once per pattern. No pattern can contribute more than its section's
+    # limit, so each scan stops once it has that many, and once a pattern is
+    # full the patterns after it in its section can no longer reach the output.
+    # Each pattern also has literals that every match must contain; a pattern
+    # whose literals are all missing from a segment is skipped without
+    # starting the regex engine.
+    found_by_section: Dict[str, List[List[str]]] = {
+        name: [[] for _ in patterns] for name, patterns, _, _ in PATTERN_GROUPS
+    }
+    active: Tuple[Tuple[Tuple["re.Pattern[str]", ...], Tuple[Tuple[str, ...], ...], List[List[str]], int], ...] = tuple(
+        (patterns, anchors, found_by_section[name], limit)
+        for name, patterns, anchors, limit in PATTERN_GROUPS
+        if not sections or name in sections
+    )
+
+    segments = iter_segments(chunks) if active else iter(())
+    for segment in segments:
+        # Scan a lowercased copy and slice matches out of the original to keep casing.
+        # The scan stays on str: sre has a separate loop per string width, so
+        # ASCII text is already matched byte by byte, and encoding to bytes
+        # first measured slower because of the extra copy.
+        scan = segment.lower()
+        case_fold = len(scan) != len(segment)
+        if case_fold:
+            # Lowercasing changed the length (e.g. U+0130), so offsets would not line up
+            scan = segment
+
+        for patterns, anchors, groups, limit in active:
+            for pattern, literals, found in zip(patterns, anchors, groups):
+                if len(found) >= limit:
+                    break
+                if case_fold:
+                    # Rare path; re caches the case-insensitive compile. The literal
+                    # prefilter is skipped because case folding can match other
+                    # characters (e.g. U+017F matches 's').
+                    pattern = re.compile(pattern.pattern, re.IGNORECASE)
+                elif not any(literal in scan for literal in literals):
+                    continue
+                matches = islice(pattern.finditer(scan), limit - len(found))
+                found += [segment[m.start():m.end()].strip() for m in matches]
+
+        # Every section's output is fixed once its first pattern is full, so
+        # the rest of the document does not need to be read
+        if all(len(groups[0]) >= limit for _, _, groups, limit in active):
+            break
+
+    return RfpAnalysis(*(
+        [m for found in found_by_section[name] for m in found][:limit] for name, _, _, limit in PATTERN_GROUPS
+    ))
@@ -1,18 +1,265 @@
+import io
+import os
 import re
+import mmap
+import codecs
 import json
+import asyncio
+import hashlib
+import functools
 import logging
+import threading
 import aiohttp
-from typing import Dict, Any, List, Optional
+import docx
+import numpy as np
+import orjson
+import pypdfium2 as pdfium
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, NamedTuple, Optional, ClassVar, FrozenSet, Iterable, Iterator, Sequence, Tuple, Union
 from pathlib import Path
 from bs4 import BeautifulSoup
 
 from agents.base_agent import BaseAgent
+from agents._scout_fastpath import RfpAnalysis, analyze_chunks
+from core.cache import TTLCache
 from core.config import OPENAI_API_KEY, ANTHROPIC_API_KEY
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the host application
 logger = logging.getLogger(__name__)
 
+# PDFium is not thread-safe and RFP files are read in worker threads, so every
+# pdfium call (open, page access, text extraction, close) holds this lock
+_PDFIUM_LOCK = threading.Lock()
+
+# Patterns used while scraping grant pages and checking eligibility, compiled once
+_AMOUNT_RE = re.compile(r'\$(\d{1,3}(?:,\d{3})*)(?:\.(\d{2}))?')
+_DATE_RE = re.compile(r'\b\d{1,2}/\d{1,2}/\d{2,4}\b')
+# Meta tags the page extractors read, found on the raw HTML so a page without
+# them is not walked in full by soup.find. Only the attribute itself is matched,
+# not the <meta ...> around it: the tag's other attributes may contain '>' in
+# quoted values, and skipping those reliably needs a pattern that is no longer
+# linear-time on malformed HTML. A false positive just costs the soup search
+_META_SITE_NAME_RE = re.compile(r'\bproperty\s*=\s*["\']?og:site_name\b', re.IGNORECASE)
+_META_DESCRIPTION_RE = re.compile(r'\bname\s*=\s*["\']?description\b', re.IGNORECASE)
+_YEARS_RE = re.compile(r'(\d+)\s*years?')
+_BUDGET_RE = re.compile(r'budget\s*(under|over|at least|maximum|minimum)?\s*\$?(\d[\d,]*)')
+
+# Eligibility requirement categories and their trigger terms, in priority order
+_ELIGIBILITY_TERMS = (
+    ("501(c)(3)", ("501(c)(3)", "501c3", "tax-exempt")),
+    ("nonprofit", ("nonprofit", "non-profit", "not for profit")),
+    ("years", ("years", "established", "history")),
+    ("budget", ("budget", "revenue", "income")),
+    ("location", ("located", "location", "area", "region"))
+)
+_ELIGIBILITY_CATEGORY_RES = tuple(
+    (category, re.compile('|'.join(map(re.escape, terms)))) for category, terms in _ELIGIBILITY_TERMS
+)
+_ELIGIBILITY_ANY_RE = re.compile('|'.join(re.escape(term) for _, terms in _ELIGIBILITY_TERMS for term in terms))
+
+def _eligibility_category(requirement_lower: str) -> Optional[str]:
+    """
+    Return the first category (in priority order) with a term in the requirement.
+    """
+    # No term of any category occurs before the first hit, so each category
+    # only needs to be searched from there
+    first = _ELIGIBILITY_ANY_RE.search(requirement_lower)
+    if first is None:
+        return None
+    for category, pattern in _ELIGIBILITY_CATEGORY_RES:
+        if pattern.search(requirement_lower, first.start()):
+            return category
+    return None
+
+# Match score weights for mission, eligibility, funding, geography and timeline (30/25/20/15/10%)
+# Kept as fractions: the component scores are floats anyway, and integer
+# percentages round ~1.4% of scores differently at half-point ties
+_MATCH_WEIGHTS = (0.30, 0.25, 0.20, 0.15, 0.10)
+# The same weights as a column, to weight a (component, grant) score matrix in one product
+_MATCH_WEIGHT_COLUMN = np.array(_MATCH_WEIGHTS)[:, np.newaxis]
+
+@functools.lru_cache(maxsize=8192)
+def _mentions_location(requirement: str, locations: Tuple[str, ...]) -> bool:
+    """
+    Return whether any of the (lowercased) locations appears in the requirement.
+    
+    Memoized because the same requirement text recurs across grants and the
+    same organization's locations are checked against every one of them.
+    """
+    # Look for location mentions in the requirement. A plain loop of C-level
+    # substring searches beats compiling the locations into one alternation:
+    # sre tries every alternative at each position, which measured up to 4x
+    # slower for 2-28 locations, and misses are memoized anyway.
+    for location in locations:
+        if location in requirement:
+            return True
+            
+    return False
+
+@functools.lru_cache(maxsize=16384)
+def _is_malformed_slash_date(deadline: str) -> bool:
+    """
+    Return whether the deadline splits by '/' into three parts that are not all whole numbers.
+    
+    Memoized because the same deadlines recur across grants and scoring passes.
+    """
+    parts = deadline.split('/')
+    if len(parts) != 3:
+        return False
+    try:
+        for part in parts:
+            int(part)
+    except ValueError:
+        return True
+    return False
+
+def _funding_bounds(ideal_funding: Dict[str, Any]) -> Tuple[Any, Optional[Any], Any]:
+    """
+    Return the (min, max, optimal) funding amounts with their defaults filled in.
+    
+    A max of None means the range has no upper bound.
+    """
+    min_amount = ideal_funding.get("min_amount", 0)
+    max_amount = ideal_funding.get("max_amount")
+    if "optimal_amount" in ideal_funding:
+        optimal_amount = ideal_funding["optimal_amount"]
+    else:
+        # Only work out the default when it is needed
+        optimal_amount = min_amount * 2 if max_amount is None else (min_amount + max_amount) / 2
+    return min_amount, max_amount, optimal_amount
+
+def _funding_match(grant_amount: float, min_amount: float, max_amount: Optional[float], optimal_amount: float) -> float:
+    """
+    Score (0-1) how well a grant amount fits the bounds from _funding_bounds.
+    
+    A max_amount of None means the range has no upper bound.
+    """
+    # Check if amount is within range. GrantScout's batch scorer evaluates
+    # every range and selects with np.where; for one grant the branches are
+    # cheaper, as computing all three and then selecting measured ~60% slower
+    if grant_amount < min_amount:
+        # Below minimum - partial score based on how close it is
+        return max(0, grant_amount / min_amount * 0.5)
+    elif max_amount is not None and grant_amount > max_amount:
+        # Above maximum - partial score based on how close it is
+        return max(0, 0.5 - (grant_amount - max_amount) / max_amount * 0.5)
+    else:
+        # Within range - full score with bonus for being close to optimal
+        base_score = 0.7
+        if optimal_amount:
+            # Calculate how close to optimal (normalized to 0-0.3 range)
+            proximity = 1 - min(abs(grant_amount - optimal_amount) / optimal_amount, 1)
+            return base_score + proximity * 0.3
+        return base_score
+
+def _geography_match(grant_geography: Sequence[str],
+                     org_service_areas: Sequence[str],
+                     area_matches: Dict[str, bool]) -> float:
+    """
+    Calculate geographic match score (0-1) against already lowercased service areas.
+    
+    area_matches memoizes whether a grant area, as given or lowercased,
+    matches any service area; it must start out mapping each service area
+    to True and can be shared by every grant scored against the same
+    service areas.
+    """
+    if not grant_geography or not org_service_areas:
+        return 0.5  # Neutral score if information is missing
+
+    # Check for direct matches: an area matches if, lowercased, it is a
+    # service area or one contains the other. Grant geographies come from a
+    # small vocabulary (states, regions), so each distinct area string is
+    # lowercased and checked once and then looked up as given
+    direct_matches = 0
+    for grant_area in grant_geography:
+        matched = area_matches.get(grant_area)
+        if matched is None:
+            area = grant_area.lower()
+            matched = area_matches.get(area)
+            if matched is None:
+                matched = area_matches[area] = any(
+                    area in org_area or org_area in area for org_area in org_service_areas
+                )
+            area_matches[grant_area] = matched
+        direct_matches += matched
+
+    # Calculate match ratio (grant_geography is non-empty here)
+    return direct_matches / len(grant_geography)
+
+class _OrgContext(NamedTuple):
+    """Organization profile with its match-relevant strings lowercased once per batch."""
+    profile: Dict[str, Any]
+    mission: str
+    focus_areas: Tuple[str, ...]
+    service_areas: Tuple[str, ...]
+    # Whether each lowercased grant area matches a service area, seeded with
+    # the service areas and filled in as new areas are scored
+    area_matches: Dict[str, bool]
+    # Whether each lowercased requirement mentions a service area, filled in as
+    # requirements are checked
+    location_matches: Dict[str, bool]
+    # Funding bounds from _funding_bounds, or None without an ideal funding range
+    funding: Optional[Tuple[Any, Optional[Any], Any]]
+
+def _make_org_ctx(org_profile: Dict[str, Any]) -> _OrgContext:
+    """
+    Build the scoring context for an organization profile.
+    
+    Missing and null (JSON null) fields are treated as empty.
+    """
+    service_areas = tuple(area.lower() for area in org_profile.get('service_areas') or ())
+    ideal_funding = org_profile.get('ideal_funding', {})
+    return _OrgContext(
+        profile=org_profile,
+        mission=(org_profile.get('mission_statement') or '').lower(),
+        focus_areas=tuple(area.lower() for area in org_profile.get('focus_areas') or ()),
+        service_areas=service_areas,
+        area_matches=dict.fromkeys(service_areas, True),
+        location_matches={},
+        funding=_funding_bounds(ideal_funding) if ideal_funding else None
+    )
+
+def _meets_location_requirement(requirement: str, org_ctx: _OrgContext) -> bool:
+    """
+    Check a lowercased location requirement against the context's service areas.
+    
+    Requirements repeat across the grants in a batch, so each one is looked up
+    in the context before falling back to the shared _mentions_location cache.
+    """
+    matched = org_ctx.location_matches.get(requirement)
+    if matched is None:
+        matched = org_ctx.location_matches[requirement] = _mentions_location(requirement, org_ctx.service_areas)
+    return matched
+
+# Heading keywords for each scraped grant page section, matched by one pattern
+_SECTION_KEYWORDS = {
+    'eligibility': ('eligibility', 'who can apply', 'eligible organizations'),
+    'requirements': ('requirements', 'how to apply', 'application process'),
+    'focus_areas': ('focus areas', 'program areas', 'priorities', 'areas of interest')
+}
+_SECTION_BY_KEYWORD = {
+    keyword: section for section, keywords in _SECTION_KEYWORDS.items() for keyword in keywords
+}
+_SECTION_RE = re.compile('|'.join(map(re.escape, _SECTION_BY_KEYWORD)), re.IGNORECASE)
+_SECTION_KEYWORD_RES = tuple(
+    (re.compile(re.escape(keyword), re.IGNORECASE), section) for keyword, section in _SECTION_BY_KEYWORD.items()
+)
+
+def _section_for_keyword(matched: str) -> str:
+    """
+    Return the section of a keyword matched by _SECTION_RE.
+    """
+    section = _SECTION_BY_KEYWORD.get(matched.casefold())
+    if section is None:
+        # IGNORECASE also pairs characters that casefold() does not map to
+        # the keyword's (e.g. U+0130 with 'i'), so find the keyword it matched
+        section = next(section for pattern, section in _SECTION_KEYWORD_RES if pattern.fullmatch(matched))
+    return section
+
+
+_HEADINGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
 class GrantScout(BaseAgent):
     """
     Agent for analyzing grant RFPs and finding grant opportunities.
@@ -25,14 +272,134 @@ class GrantScout(BaseAgent):
     5. Searching for grants via Candid API
     6. Matching grants to organization profiles
     """
-    
+
+    # LRU cache of analysis results keyed by content hash and sections of interest
+    _RESULT_CACHE_SIZE = 256
+    _result_cache: ClassVar["OrderedDict[str, RfpAnalysis]"] = OrderedDict()
+    # RFP analysis runs in worker threads, so cache updates are serialized
+    _result_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Base URL for Candid API
+    _CANDID_API_URL = "https://api.candid.org/v1/grants"
+
+    # Upper bound on grant sources fetched at the same time by search_grants
+    _FETCH_CONCURRENCY = 10
+
+    # Seconds to keep fetched grants; search listings change faster than grant pages
+    _CANDID_CACHE_TTL = 3600
+    _URL_CACHE_TTL = 86400
+    # Most fetched results kept per agent; the least recently used are dropped first
+    _FETCH_CACHE_SIZE = 256
+
     def __init__(self):
         super().__init__(
             name="GrantScout",
             description="Analyzes RFPs and finds grant opportunities matching organization profiles"
         )
-        self.supported_file_types = ['.pdf', '.docx', '.txt']
+        # Text extractor for each supported file type
+        self._extractors = {
+            '.pdf': self._extract_pdf,
+            '.docx': self._extract_docx,
+            '.txt': self._iter_text_chunks
+        }
+        self.supported_file_types: FrozenSet[str] = frozenset(self._extractors)
+        # Common eligibility criteria to check, keyed by requirement category; each
+        # takes the lowercased requirement and the organization's scoring context
+        self._criteria_checkers = {
+            "501(c)(3)": lambda requirement, org_ctx: org_ctx.profile.get("is_501c3", False),
+            "nonprofit": lambda requirement, org_ctx: org_ctx.profile.get("is_nonprofit", False),
+            "years": lambda requirement, org_ctx: self._check_years_requirement(requirement, org_ctx.profile),
+            "budget": lambda requirement, org_ctx: self._check_budget_requirement(requirement, org_ctx.profile),
+            "location": _meets_location_requirement
+        }
+        # HTTP session shared by every request this agent makes; created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Event loop the session was created on; a session cannot be used from another loop
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Open `async with` blocks on the agent; the session is closed when the last one exits
+        self._session_users = 0
+        # Grants already fetched from the Candid API or a grant page
+        self._cache = TTLCache(maxsize=self._FETCH_CACHE_SIZE)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the agent's HTTP session, creating it on first use.
+
+        Reusing one session keeps connections (and their TLS handshakes) alive
+        between requests instead of rebuilding the pool for every fetch.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            # The session's connections belong to the loop that created it, e.g.
+            # an earlier asyncio.run() that has since finished, so start over
+            await self._discard_session()
+        if self._session is None or self._session.closed:
+            self._session_loop = loop
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def _discard_session(self) -> None:
+        """
+        Close and drop a session created on an event loop that is no longer running.
         
+        search_grants and `async with` close the session before their loop
+        ends, so this is only reached when the fetch helpers were called
+        directly and the agent was never closed.
+        """
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None:
+            try:
+                await session.close()
+            except RuntimeError:
+                # Transports still open on a closed loop cannot be closed
+                # through it; the session is dropped either way
+                pass
+
+    async def aclose(self) -> None:
+        """
+        Close the agent's HTTP session, if one was opened.
+        """
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None:
+            await session.close()
+
+    async def __aenter__(self) -> "GrantScout":
+        """
+        Keep the agent's HTTP session open until the matching __aexit__.
+        
+        Use `async with GrantScout() as scout:` to share one session across
+        several searches; a search outside such a block closes the session
+        when it finishes.
+        """
+        self._session_users += 1
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """
+        Close the HTTP session when the outermost `async with` block exits.
+        """
+        self._session_users -= 1
+        if not self._session_users:
+            await self.aclose()
+
+    def clear_caches(self) -> None:
+        """
+        Drop cached fetches, RFP analyses and memoized scoring lookups.
+        
+        Every cache is bounded, so this is only needed to free memory or pick up
+        changed pages early in a long-running service. The RFP analysis and
+        scoring caches are shared by all GrantScout instances.
+        """
+        self._cache.clear()
+        with self._result_cache_lock:
+            self._result_cache.clear()
+        _mentions_location.cache_clear()
+        _is_malformed_slash_date.cache_clear()
+
     async def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """
         Validate that the input contains necessary information.
@@ -46,6 +413,7 @@ class GrantScout(BaseAgent):
         Optional:
         - file_type: Type of file (for raw content)
         - sections_of_interest: List of specific sections to focus on
+          (requirements, eligibility, deadlines, scoring_criteria)
         - org_profile: Organization profile for matching
         """
         if not input_data:
@@ -54,16 +422,18 @@ class GrantScout(BaseAgent):
             
         # Check for RFP analysis mode
         if 'file_path' in input_data or 'content' in input_data:
-            # If file_path is provided, verify it exists and is supported
+            # If file_path is provided, verify it is supported. Existence is not
+            # checked here; extraction reports a missing file when it opens it.
             if 'file_path' in input_data:
                 file_path = Path(input_data['file_path'])
-                if not file_path.exists():
-                    logger.error(f"File not found: {file_path}")
+                suffix = file_path.suffix.lower()
+                if suffix not in self.supported_file_types:
+                    logger.error("Unsupported file type: %s", file_path.suffix)
                     return False
                     
-                if file_path.suffix.lower() not in self.supported_file_types:
-                    logger.error(f"Unsupported file type: {file_path.suffix}")
-                    return False
+                # Keep the resolved path so _extract_text does not rebuild it
+                input_data['_path'] = file_path
+                input_data['_suffix'] = suffix
             return True
                     
         # Check for grant search mode
@@ -95,21 +465,35 @@ class GrantScout(BaseAgent):
                 org_profile = input_data.get('org_profile', {})
                 return await self.search_grants(search_criteria, org_profile)
             else:
-                # RFP analysis mode
-                document_text = await self._extract_text(input_data)
-                results = await self._analyze_document(document_text, input_data.get('sections_of_interest'))
+                # RFP analysis mode; file reads and scanning block, so keep them off the event loop
+                requirements, eligibility, deadlines, scoring_criteria = await asyncio.to_thread(
+                    self._analyze_input, input_data)
                 
                 return {
                     "success": True,
-                    "requirements": results.get("requirements", []),
-                    "eligibility": results.get("eligibility", []),
-                    "deadlines": results.get("deadlines", []),
-                    "scoring_criteria": results.get("scoring_criteria", [])
+                    "requirements": requirements,
+                    "eligibility": eligibility,
+                    "deadlines": deadlines,
+                    "scoring_criteria": scoring_criteria
                 }
+        except FileNotFoundError:
+            file_path = input_data.get('file_path')
+            logger.error("File not found: %s", file_path)
+            return {"error": f"File not found: {file_path}", "success": False}
         except Exception as e:
-            logger.error(f"Error processing input: {str(e)}")
+            logger.error("Error processing input: %s", e)
             return {"error": str(e), "success": False}
     
+    def process_batch(self, inputs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Process many inputs in parallel across worker processes.
+        
+        Each input is independent, so it is handled by a fresh agent in a worker
+        process. Results are returned in the same order as `inputs`.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(_process_in_worker, inputs, chunksize=4))
+    
     async def search_grants(self, search_criteria: Dict[str, Any], org_profile: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Search for grants using various sources including Candid API.
@@ -123,30 +507,52 @@ class GrantScout(BaseAgent):
           - min_amount: Minimum grant amount
           - max_amount: Maximum grant amount
           - api_key: Candid API key (if using API)
-          - url: Specific URL to analyze (if direct source)
+          - url: Specific URL (or list of URLs) to analyze (if direct source)
         - org_profile: Organization profile for matching score calculation
+        
+        The sources are independent, so they are fetched concurrently; results
+        keep the order of the sources above.
         """
-        results = []
+        tasks = []
         
         # If API key is provided, search using Candid API
         if 'api_key' in search_criteria:
-            api_results = await self._search_candid_api(search_criteria)
-            results.extend(api_results)
+            tasks.append(self._search_candid_api(search_criteria))
         
-        # If URL is provided, analyze specific grant page
+        # If URL is provided, analyze specific grant page(s)
         if 'url' in search_criteria:
-            url_results = await self._analyze_grant_url(search_criteria['url'])
-            results.extend(url_results)
+            urls = search_criteria['url']
+            if isinstance(urls, str):
+                urls = [urls]
+            tasks.extend(self._analyze_grant_url(url) for url in urls)
         
         # If keywords are provided without API, perform web search
         if 'keywords' in search_criteria and 'api_key' not in search_criteria and 'url' not in search_criteria:
-            web_results = await self._search_grants_web(search_criteria)
-            results.extend(web_results)
+            tasks.append(self._search_grants_web(search_criteria))
+        
+        # Bound the number of requests in flight so a long URL list doesn't flood the targets
+        semaphore = asyncio.Semaphore(self._FETCH_CONCURRENCY)
+        
+        async def fetch(task):
+            async with semaphore:
+                return await task
+        
+        # Hold the session open for the fetches; it is closed afterwards unless
+        # the caller holds the agent open with `async with`
+        async with self:
+            groups = await asyncio.gather(*map(fetch, tasks), return_exceptions=True)
+        
+        results = []
+        for group in groups:
+            if isinstance(group, BaseException):
+                logger.error("Error fetching grants: %s", group)
+                continue
+            results.extend(group)
         
         # Calculate match scores if organization profile is provided
         if org_profile:
-            for grant in results:
-                grant['match_score'] = self.calculate_match_score(grant, org_profile)
+            for grant, score in zip(results, self.score_grants_batch(results, org_profile)):
+                grant['match_score'] = score
                 
             # Sort by match score (highest first)
             results = sorted(results, key=lambda x: x.get('match_score', 0), reverse=True)
@@ -166,148 +572,169 @@ class GrantScout(BaseAgent):
             logger.error("Candid API key not provided")
             return []
         
-        # Base URL for Candid API
-        api_url = "https://api.candid.org/v1/grants"
-        
-        # Construct API request parameters
-        params = {
-            'key': api_key,
-            'q': ' '.join(criteria.get('keywords', [])),
-            'subject': ','.join(criteria.get('subject_areas', [])),
-            'funder_type': ','.join(criteria.get('funder_types', [])),
-            'min_amount': criteria.get('min_amount'),
-            'max_amount': criteria.get('max_amount'),
-            'geography': ','.join(criteria.get('geography', [])),
-            'limit': criteria.get('limit', 20)
-        }
+        api_url = self._CANDID_API_URL
+        
+        # Construct API request parameters, leaving out missing values and empty strings
+        params = {'key': api_key}
+        if (keywords := ' '.join(criteria.get('keywords') or ())):
+            params['q'] = keywords
+        if (subject_areas := ','.join(criteria.get('subject_areas') or ())):
+            params['subject'] = subject_areas
+        if (funder_types := ','.join(criteria.get('funder_types') or ())):
+            params['funder_type'] = funder_types
+        if (min_amount := criteria.get('min_amount')) is not None and min_amount != '':
+            params['min_amount'] = min_amount
+        if (max_amount := criteria.get('max_amount')) is not None and max_amount != '':
+            params['max_amount'] = max_amount
+        if (geography := ','.join(criteria.get('geography') or ())):
+            params['geography'] = geography
+        if (limit := criteria.get('limit', 20)) is not None and limit != '':
+            params['limit'] = limit
         
-        # Remove None values and empty strings
-        params = {k: v for k, v in params.items() if v is not None and v != ''}
+        cache_key = 'candid:' + hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(api_url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"Candid API error: {response.status} - {await response.text()}")
-                        return []
-                    
-                    data = await response.json()
-                    
-                    # Transform API response to our standard grant format
-                    grants = []
-                    for item in data.get('grants', []):
-                        grant = {
-                            'title': item.get('title', 'Unknown Grant'),
-                            'funder': item.get('funder', {}).get('name', 'Unknown Funder'),
-                            'amount': item.get('amount', {}).get('amount', 0),
-                            'deadline': item.get('application_deadline', 'Unknown'),
-                            'description': item.get('description', ''),
-                            'url': item.get('url', ''),
-                            'eligibility': item.get('eligibility', []),
-                            'requirements': item.get('requirements', []),
-                            'focus_areas': item.get('subject_areas', []),
-                            'geography': item.get('geography', []),
-                            'source': 'candid_api'
-                        }
-                        grants.append(grant)
-                    
-                    return grants
+            session = await self._get_session()
+            async with session.get(api_url, params=params) as response:
+                if response.status != 200:
+                    # Only download the error body when it will actually be logged
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error("Candid API error: %s - %s", response.status, await response.text())
+                    return []
+                
+                # Parse the raw body with orjson rather than the stdlib json used by response.json()
+                data = orjson.loads(await response.read())
+                
+                # Transform API response to our standard grant format
+                grants = []
+                for item in data.get('grants', []):
+                    grant = {
+                        'title': item.get('title', 'Unknown Grant'),
+                        'funder': item.get('funder', {}).get('name', 'Unknown Funder'),
+                        'amount': item.get('amount', {}).get('amount', 0),
+                        'deadline': item.get('application_deadline', 'Unknown'),
+                        'description': item.get('description', ''),
+                        'url': item.get('url', ''),
+                        'eligibility': item.get('eligibility', []),
+                        'requirements': item.get('requirements', []),
+                        'focus_areas': item.get('subject_areas', []),
+                        'geography': item.get('geography', []),
+                        'source': 'candid_api'
+                    }
+                    grants.append(grant)
+                
+                self._cache.set(cache_key, grants, expire=self._CANDID_CACHE_TTL)
+                return grants
         except Exception as e:
-            logger.error(f"Error searching Candid API: {str(e)}")
+            logger.error("Error searching Candid API: %s", e)
             return []
             
     async def _analyze_grant_url(self, url: str) -> List[Dict[str, Any]]:
         """
         Analyze a specific grant opportunity URL.
         """
+        cache_key = 'url:' + hashlib.sha1(url.encode()).hexdigest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Fetch webpage content
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        logger.error(f"Error fetching URL {url}: {response.status}")
-                        return []
-                    
-                    html = await response.text()
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status != 200:
+                    logger.error("Error fetching URL %s: %s", url, response.status)
+                    return []
+                
+                html = await response.text()
             
-            # Parse HTML content with BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            # Parse HTML content with BeautifulSoup, using lxml's C parser
+            soup = BeautifulSoup(html, 'lxml')
             
             # Extract grant details (simplified example - would be more complex in practice)
             title = soup.find('h1')
             title_text = title.text.strip() if title else 'Unknown Grant'
             
+            # Flatten the page text and walk the section headings once, then share the results
+            page_text = soup.get_text()
+            page_text_lower = page_text.lower()
+            sections = self._extract_sections(soup)
+            
             # This is a simplified extraction - real implementation would be more robust
             grant = {
                 'title': title_text,
-                'funder': self._extract_funder(soup),
-                'amount': self._extract_amount(soup),
-                'deadline': self._extract_deadline(soup),
-                'description': self._extract_description(soup),
+                'funder': self._extract_funder(soup, html),
+                'amount': self._extract_amount(soup, page_text),
+                'deadline': self._extract_deadline(soup, text_lower=page_text_lower),
+                'description': self._extract_description(soup, html),
                 'url': url,
-                'eligibility': self._extract_eligibility(soup),
-                'requirements': self._extract_requirements(soup),
-                'focus_areas': self._extract_focus_areas(soup),
+                'eligibility': sections['eligibility'],
+                'requirements': sections['requirements'],
+                'focus_areas': sections['focus_areas'],
                 'geography': [],
                 'source': 'direct_url'
             }
             
+            self._cache.set(cache_key, [grant], expire=self._URL_CACHE_TTL)
             return [grant]
         except Exception as e:
-            logger.error(f"Error analyzing URL {url}: {str(e)}")
+            logger.error("Error analyzing URL %s: %s", url, e)
             return []
             
-    def _extract_funder(self, soup: BeautifulSoup) -> str:
-        """Extract funder name from soup - placeholder implementation."""
+    def _extract_funder(self, soup: BeautifulSoup, html: Optional[str] = None) -> str:
+        """Extract funder name from soup (skipping the search if its raw html has no site name) - placeholder implementation."""
         # In a real implementation, this would have more sophisticated extraction logic
+        if html is not None and not _META_SITE_NAME_RE.search(html):
+            return 'Unknown Funder'
         funder_elem = soup.find('meta', property='og:site_name')
         if funder_elem and funder_elem.get('content'):
             return funder_elem.get('content')
         return 'Unknown Funder'
     
-    def _extract_amount(self, soup: BeautifulSoup) -> int:
-        """Extract grant amount from soup - placeholder implementation."""
-        # In a real implementation, this would use regex and more robust parsing
-        amount = 0
-        try:
-            # Look for dollar amounts in the text
+    def _extract_amount(self, soup: BeautifulSoup, text: Optional[str] = None) -> int:
+        """Extract grant amount from soup (or its precomputed text) - placeholder implementation."""
+        # In a real implementation, this would use more robust parsing
+        if text is None:
             text = soup.get_text()
-            # Simple regex to find dollar amounts
-            matches = re.findall(r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', text)
-            if matches:
-                # Convert first match to integer
-                amount_str = matches[0].replace(',', '')
-                amount = int(float(amount_str))
-        except Exception as e:
-            logger.warning(f"Error extracting amount: {str(e)}")
-        return amount
+        # The first dollar amount wins; whole dollars are captured apart from the cents
+        match = _AMOUNT_RE.search(text)
+        if not match:
+            return 0
+        return int(match.group(1).replace(',', ''))
     
-    def _extract_deadline(self, soup: BeautifulSoup) -> str:
-        """Extract application deadline from soup - placeholder implementation."""
+    def _extract_deadline(self, soup: BeautifulSoup, text: Optional[str] = None, text_lower: Optional[str] = None) -> str:
+        """Extract application deadline from soup (or its precomputed text or lowercased text) - placeholder implementation."""
         # Look for deadline indicators
-        text = soup.get_text().lower()
+        if text_lower is None:
+            if text is None:
+                text = soup.get_text()
+            text_lower = text.lower()
         deadline_indicators = [
             'deadline', 'due date', 'submission date', 'applications due'
         ]
         
         for indicator in deadline_indicators:
-            idx = text.find(indicator)
+            idx = text_lower.find(indicator)
             if idx >= 0:
                 # Extract text around the indicator
-                context = text[idx:idx+100]
+                context = text_lower[idx:idx+100]
                 # Look for date patterns (very simplified)
-                date_matches = re.findall(r'\b\d{1,2}/\d{1,2}/\d{2,4}\b', context)
+                date_matches = _DATE_RE.findall(context)
                 if date_matches:
                     return date_matches[0]
         
         return 'Unknown'
     
-    def _extract_description(self, soup: BeautifulSoup) -> str:
-        """Extract grant description from soup - placeholder implementation."""
+    def _extract_description(self, soup: BeautifulSoup, html: Optional[str] = None) -> str:
+        """Extract grant description from soup (skipping the meta search if its raw html has none) - placeholder implementation."""
         # Look for meta description first
-        meta_desc = soup.find('meta', {'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc.get('content')
+        if html is None or _META_DESCRIPTION_RE.search(html):
+            meta_desc = soup.find('meta', {'name': 'description'})
+            if meta_desc and meta_desc.get('content'):
+                return meta_desc.get('content')
         
         # Fallback to first paragraph
         first_p = soup.find('p')
@@ -316,81 +743,54 @@ class GrantScout(BaseAgent):
         
         return 'No description available'
     
+    def _extract_sections(self, soup: BeautifulSoup) -> Dict[str, List[str]]:
+        """
+        Extract eligibility, requirements and focus areas from soup - placeholder implementation.
+        
+        The page's strings are walked once and every section keyword is tested
+        with a single pattern, instead of one full walk per keyword.
+        """
+        sections: Dict[str, List[str]] = {section: [] for section in _SECTION_KEYWORDS}
+        
+        for element in soup.find_all(string=_SECTION_RE):
+            parent = element.parent
+            if parent.name not in _HEADINGS:
+                continue
+                
+            # Found a section heading, extract the content after it
+            next_elem = parent.find_next(['p', 'ul', 'ol'])
+            if not next_elem:
+                continue
+                
+            matched = {_section_for_keyword(m.group(0)) for m in _SECTION_RE.finditer(element)}
+            if next_elem.name == 'ul' or next_elem.name == 'ol':
+                # Extract list items
+                items = [li.get_text().strip() for li in next_elem.find_all('li')]
+                for section in matched:
+                    sections[section].extend(items)
+            else:
+                # Extract paragraph text
+                text = next_elem.get_text().strip()
+                for section in matched:
+                    # Split focus areas by commas if it looks like a list
+                    if section == 'focus_areas' and ',' in text:
+                        sections[section].extend(area.strip() for area in text.split(','))
+                    else:
+                        sections[section].append(text)
+        
+        return sections
+    
     def _extract_eligibility(self, soup: BeautifulSoup) -> List[str]:
         """Extract eligibility requirements from soup - placeholder implementation."""
-        eligibility = []
-        # Look for sections that might contain eligibility info
-        keywords = ['eligibility', 'who can apply', 'eligible organizations']
-        
-        for keyword in keywords:
-            elements = soup.find_all(string=re.compile(keyword, re.IGNORECASE))
-            for element in elements:
-                parent = element.parent
-                if parent.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    # Found a heading about eligibility, extract the content after it
-                    next_elem = parent.find_next(['p', 'ul', 'ol'])
-                    if next_elem:
-                        if next_elem.name == 'ul' or next_elem.name == 'ol':
-                            # Extract list items
-                            for li in next_elem.find_all('li'):
-                                eligibility.append(li.get_text().strip())
-                        else:
-                            # Extract paragraph text
-                            eligibility.append(next_elem.get_text().strip())
-        
-        return eligibility
+        return self._extract_sections(soup)['eligibility']
     
     def _extract_requirements(self, soup: BeautifulSoup) -> List[str]:
         """Extract application requirements from soup - placeholder implementation."""
-        # Similar approach to eligibility extraction
-        requirements = []
-        keywords = ['requirements', 'how to apply', 'application process']
-        
-        for keyword in keywords:
-            elements = soup.find_all(string=re.compile(keyword, re.IGNORECASE))
-            for element in elements:
-                parent = element.parent
-                if parent.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    # Found a heading about requirements, extract the content after it
-                    next_elem = parent.find_next(['p', 'ul', 'ol'])
-                    if next_elem:
-                        if next_elem.name == 'ul' or next_elem.name == 'ol':
-                            # Extract list items
-                            for li in next_elem.find_all('li'):
-                                requirements.append(li.get_text().strip())
-                        else:
-                            # Extract paragraph text
-                            requirements.append(next_elem.get_text().strip())
-        
-        return requirements
+        return self._extract_sections(soup)['requirements']
     
     def _extract_focus_areas(self, soup: BeautifulSoup) -> List[str]:
         """Extract focus areas from soup - placeholder implementation."""
-        focus_areas = []
-        keywords = ['focus areas', 'program areas', 'priorities', 'areas of interest']
-        
-        for keyword in keywords:
-            elements = soup.find_all(string=re.compile(keyword, re.IGNORECASE))
-            for element in elements:
-                parent = element.parent
-                if parent.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    # Found a heading about focus areas, extract the content after it
-                    next_elem = parent.find_next(['p', 'ul', 'ol'])
-                    if next_elem:
-                        if next_elem.name == 'ul' or next_elem.name == 'ol':
-                            # Extract list items
-                            for li in next_elem.find_all('li'):
-                                focus_areas.append(li.get_text().strip())
-                        else:
-                            # Extract paragraph text
-                            text = next_elem.get_text().strip()
-                            # Split by commas if it looks like a list
-                            if ',' in text:
-                                focus_areas.extend([area.strip() for area in text.split(',')])
-                            else:
-                                focus_areas.append(text)
-        
-        return focus_areas
+        return self._extract_sections(soup)['focus_areas']
             
     async def _search_grants_web(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -401,100 +801,129 @@ class GrantScout(BaseAgent):
         logger.info("Web search for grants not yet implemented")
         return []
             
-    async def _extract_text(self, input_data: Dict[str, Any]) -> str:
+    def _analyze_input(self, input_data: Dict[str, Any]) -> RfpAnalysis:
+        """
+        Extract and analyze the RFP described by input_data.
+        
+        Blocking (disk reads and pattern scans), so process runs it in a worker thread.
+        """
+        return self._analyze_document(self._extract_text(input_data), input_data.get('sections_of_interest'))
+    
+    def _extract_text(self, input_data: Dict[str, Any]) -> Union[str, Iterator[str]]:
         """
         Extract text from RFP document.
+
+        Raw content is returned as-is; .txt files are returned as a lazy
+        iterator of chunks so large documents are never held in memory whole.
         """
         # If raw content is provided, return it directly
         if 'content' in input_data:
             return input_data['content']
             
         # If file path is provided, extract content based on file type
-        file_path = Path(input_data['file_path'])
-        suffix = file_path.suffix.lower()
+        if '_path' in input_data:
+            file_path, suffix = input_data['_path'], input_data['_suffix']
+        else:
+            file_path = Path(input_data['file_path'])
+            suffix = file_path.suffix.lower()
+        extractor = self._extractors.get(suffix)
+        if extractor is None:
+            return ""
+        return extractor(file_path)
+
+    def _extract_pdf(self, file_path: Path) -> Iterator[str]:
+        """
+        Yield the text of a PDF file one page at a time.
         
-        if suffix == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-                
-        elif suffix == '.pdf':
-            # Placeholder for PDF extraction
-            # In a real implementation, we'd use PyPDF2 or similar
-            logger.info("PDF extraction not yet implemented")
-            return "PDF CONTENT PLACEHOLDER"
-            
-        elif suffix == '.docx':
-            # Placeholder for DOCX extraction
-            # In a real implementation, we'd use python-docx
-            logger.info("DOCX extraction not yet implemented")
-            return "DOCX CONTENT PLACEHOLDER"
-            
-        return ""
+        Uses pdfium's C++ text extraction, which is several times faster than
+        the pure-Python PDF parsers. Pages without any characters (scans,
+        charts, decorative pages) are skipped without building their text.
+        """
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(str(file_path))
+        try:
+            with _PDFIUM_LOCK:
+                page_count = len(pdf)
+            for index in range(page_count):
+                # Extract each page under the lock, but yield outside it so the
+                # lock is not held while the caller scans the text
+                text = None
+                with _PDFIUM_LOCK:
+                    page = pdf[index]
+                    try:
+                        textpage = page.get_textpage()
+                        try:
+                            if textpage.count_chars() > 0:
+                                text = textpage.get_text_range()
+                        finally:
+                            textpage.close()
+                    finally:
+                        page.close()
+                if text is not None:
+                    # pdfium separates lines with CRLF; normalize to match .txt input
+                    yield text.replace('\r\n', '\n') + '\n'
+        finally:
+            with _PDFIUM_LOCK:
+                pdf.close()
+
+    def _extract_docx(self, file_path: Path) -> str:
+        """Extract paragraph text from a DOCX file."""
+        # Open the file ourselves so a missing file raises FileNotFoundError
+        with open(file_path, 'rb') as f:
+            document = docx.Document(f)
+        return '\n'.join(paragraph.text for paragraph in document.paragraphs)
+
+    @staticmethod
+    def _iter_text_chunks(file_path: Path, chunk_size: int = 65536) -> Iterator[str]:
+        """
+        Yield decoded chunks of a UTF-8 text file.
         
-    async def _analyze_document(self, text: str, sections_of_interest: Optional[List[str]] = None) -> Dict[str, Any]:
+        The file is memory-mapped and decoded slice by slice straight from the
+        page cache. Newlines are translated the same way as text-mode open().
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+                for start in range(0, size, chunk_size):
+                    end = start + chunk_size
+                    chunk = decoder.decode(mm[start:end], final=end >= size)
+                    if chunk:
+                        yield chunk
+
+    def _analyze_document(self, text: Union[str, Iterable[str]], sections_of_interest: Optional[List[str]] = None) -> RfpAnalysis:
         """
         Analyze document text to extract requirements, eligibility, deadlines, and scoring criteria.
+
+        `text` may be a single string or an iterable of chunks from a streamed file.
+        If `sections_of_interest` is non-empty, only those sections are extracted.
+        Results for string input are cached by content hash, so re-analyzing the
+        same RFP is a dictionary lookup.
         """
-        # Sample identification of requirements (very basic regex patterns)
-        requirements = []
-        eligibility = []
-        deadlines = []
-        scoring_criteria = []
-        
-        # Simple pattern matching for demonstration
-        req_patterns = [
-            r"(?:must|should|shall|required to) ([^\.]+)",
-            r"requirement[s]?:?\s*([^\.]+)",
-            r"applicants must ([^\.]+)"
-        ]
-        
-        for pattern in req_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                requirements.append(match.group(0).strip())
-                
-        # Look for eligibility information
-        elig_patterns = [
-            r"eligibility:?\s*([^\.]+)",
-            r"eligible (?:organizations|applicants|entities)[\s:]+([^\.]+)",
-            r"who can apply:?\s*([^\.]+)"
-        ]
-        
-        for pattern in elig_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                eligibility.append(match.group(0).strip())
-                
-        # Look for deadline information
-        deadline_patterns = [
-            r"deadline:?\s*([^\.\n]+)",
-            r"due (?:date|by):?\s*([^\.\n]+)",
-            r"submissions due:?\s*([^\.\n]+)"
-        ]
-        
-        for pattern in deadline_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                deadlines.append(match.group(0).strip())
-                
-        # Look for scoring criteria
-        scoring_patterns = [
-            r"scoring criteria:?\s*([^\.]+)",
-            r"evaluation criteria:?\s*([^\.]+)",
-            r"(?:proposals|applications) will be (?:evaluated|judged|scored) (?:based on|according to):?\s*([^\.]+)"
-        ]
-        
-        for pattern in scoring_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                scoring_criteria.append(match.group(0).strip())
-        
-        return {
-            "requirements": requirements[:10],  # Limit for demonstration
-            "eligibility": eligibility[:5],
-            "deadlines": deadlines[:3],
-            "scoring_criteria": scoring_criteria[:5]
-        }
+        cache_key = None
+        if isinstance(text, str):
+            digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+            cache_key = f"{digest}|{sections_of_interest or None!r}"
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                return RfpAnalysis(*map(list, cached))
+            text = (text,)
+
+        results = analyze_chunks(text, sections_of_interest)
+
+        if cache_key is not None:
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = results
+                if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            # Hand out copies so callers cannot modify the cached lists
+            return RfpAnalysis(*map(list, results))
+        return results
     
     def calculate_match_score(self, grant: Dict[str, Any], org_profile: Dict[str, Any]) -> int:
         """
@@ -509,56 +938,85 @@ class GrantScout(BaseAgent):
         """
         if not org_profile:
             return 0
-            
-        # Initialize scoring components with weights
-        mission_weight = 0.30  # 30% of total score
-        eligibility_weight = 0.25  # 25% of total score
-        funding_weight = 0.20  # 20% of total score
-        geography_weight = 0.15  # 15% of total score
-        timeline_weight = 0.10  # 10% of total score
-        
-        # 1. Mission Alignment (0-100 points)
-        mission_score = self._calculate_mission_alignment(
+        
+        # Calculate weighted total score
+        components = self._match_components(grant, _make_org_ctx(org_profile))
+        total_score = sum(score * weight for score, weight in zip(components, _MATCH_WEIGHTS)) * 100
+        
+        # Round to nearest integer and ensure within 0-100 range
+        return min(100, max(0, round(total_score)))
+    
+    def score_grants_batch(self, grants: List[Dict[str, Any]], org_profile: Dict[str, Any]) -> List[int]:
+        """
+        Calculate match scores for many grants at once.
+        
+        Returns the same scores as calling calculate_match_score on each grant,
+        but scores funding and weights, rounds and clamps the totals as whole arrays.
+        """
+        if not org_profile or not grants:
+            return [0] * len(grants)
+        
+        # Lowercase the profile once for the whole batch, then one row of component scores (0-1)
+        # per component, in the order of _MATCH_WEIGHTS
+        org_ctx = _make_org_ctx(org_profile)
+        org_capacity = org_profile.get('capacity', {})
+        components = np.array((
+            [self._mission_alignment(grant.get('focus_areas', []), org_ctx.mission, org_ctx.focus_areas)
+             for grant in grants],
+            [self._eligibility_match(grant.get('eligibility', []), org_ctx) for grant in grants],
+            self._calculate_funding_match_batch(
+                [grant.get('amount', 0) for grant in grants], org_profile.get('ideal_funding', {})),
+            [_geography_match(grant.get('geography', []), org_ctx.service_areas, org_ctx.area_matches)
+             for grant in grants],
+            [self._calculate_timeline_match(grant.get('deadline', ''), org_capacity) for grant in grants]
+        ), dtype=np.float64)
+        
+        # Weighted sum over the components; summing along axis 0 adds the rows one
+        # after another, in the same order as calculate_match_score
+        total_scores = (components * _MATCH_WEIGHT_COLUMN).sum(axis=0) * 100
+        
+        return np.clip(np.round(total_scores), 0, 100).astype(np.int64).tolist()
+    
+    def _match_components(self, grant: Dict[str, Any], org_ctx: _OrgContext) -> Tuple[float, float, float, float, float]:
+        """
+        Calculate the component scores (0-1) weighted by _MATCH_WEIGHTS.
+        """
+        org_profile = org_ctx.profile
+        
+        # 1. Mission Alignment
+        mission_score = self._mission_alignment(
             grant.get('focus_areas', []),
-            org_profile.get('mission_statement', ''),
-            org_profile.get('focus_areas', [])
+            org_ctx.mission,
+            org_ctx.focus_areas
         )
         
-        # 2. Eligibility Match (0-100 points)
-        eligibility_score = self._calculate_eligibility_match(
+        # 2. Eligibility Match
+        eligibility_score = self._eligibility_match(
             grant.get('eligibility', []),
-            org_profile
+            org_ctx
         )
         
-        # 3. Funding Amount (0-100 points)
-        funding_score = self._calculate_funding_match(
-            grant.get('amount', 0),
-            org_profile.get('ideal_funding', {})
-        )
+        # 3. Funding Amount, against the bounds computed once for the batch
+        grant_amount = grant.get('amount', 0)
+        if grant_amount and org_ctx.funding is not None:
+            funding_score = _funding_match(grant_amount, *org_ctx.funding)
+        else:
+            funding_score = 0.5  # Neutral score if information is missing
         
-        # 4. Geographic Focus (0-100 points)
-        geography_score = self._calculate_geography_match(
+        # 4. Geographic Focus
+        geography_score = _geography_match(
             grant.get('geography', []),
-            org_profile.get('service_areas', [])
+            org_ctx.service_areas,
+            org_ctx.area_matches
         )
         
-        # 5. Timeline Compatibility (0-100 points)
+        # 5. Timeline Compatibility
         timeline_score = self._calculate_timeline_match(
             grant.get('deadline', ''),
             org_profile.get('capacity', {})
         )
         
-        # Calculate weighted total score
-        total_score = (
-            mission_score * mission_weight + 
-            eligibility_score * eligibility_weight + 
-            funding_score * funding_weight + 
-            geography_score * geography_weight + 
-            timeline_score * timeline_weight
-        ) * 100
-        
-        # Round to nearest integer and ensure within 0-100 range
-        return min(100, max(0, round(total_score)))
+        return mission_score, eligibility_score, funding_score, geography_score, timeline_score
     
     def _calculate_mission_alignment(self, 
                                     grant_focus_areas: List[str], 
@@ -567,25 +1025,33 @@ class GrantScout(BaseAgent):
         """
         Calculate mission alignment score (0-1).
         """
+        return self._mission_alignment(
+            grant_focus_areas, (org_mission or '').lower(), [area.lower() for area in org_focus_areas or ()])
+    
+    def _mission_alignment(self, 
+                           grant_focus_areas: List[str], 
+                           org_mission: str, 
+                           org_focus_areas: Sequence[str]) -> float:
+        """
+        Calculate mission alignment score (0-1) against an already lowercased mission and focus areas.
+        """
         if not grant_focus_areas or (not org_mission and not org_focus_areas):
             return 0.0
             
-        # Convert everything to lowercase for better matching
+        # Convert the grant's areas to lowercase for better matching
         grant_focus_areas = [area.lower() for area in grant_focus_areas]
-        org_mission = org_mission.lower()
-        org_focus_areas = [area.lower() for area in org_focus_areas]
         
         # Calculate direct matches between focus areas
         direct_matches = 0
         for grant_area in grant_focus_areas:
             for org_area in org_focus_areas:
-                # Check for exact matches or if one contains the other
-                if grant_area == org_area or grant_area in org_area or org_area in grant_area:
+                # Check if one contains the other (which covers exact matches)
+                if grant_area in org_area or org_area in grant_area:
                     direct_matches += 1
                     break
         
-        # Calculate match ratio based on direct matches
-        direct_match_score = direct_matches / len(grant_focus_areas) if grant_focus_areas else 0
+        # Calculate match ratio based on direct matches (grant_focus_areas is non-empty here)
+        direct_match_score = direct_matches / len(grant_focus_areas)
         
         # Check if grant focus areas appear in mission statement
         mission_matches = 0
@@ -594,7 +1060,7 @@ class GrantScout(BaseAgent):
                 mission_matches += 1
         
         # Calculate match ratio based on mission statement
-        mission_match_score = mission_matches / len(grant_focus_areas) if grant_focus_areas else 0
+        mission_match_score = mission_matches / len(grant_focus_areas)
         
         # Combine scores (giving more weight to direct matches)
         return direct_match_score * 0.7 + mission_match_score * 0.3
@@ -603,18 +1069,15 @@ class GrantScout(BaseAgent):
         """
         Calculate eligibility match score (0-1).
         """
+        return self._eligibility_match(grant_eligibility, _make_org_ctx(org_profile))
+    
+    def _eligibility_match(self, grant_eligibility: List[str], org_ctx: _OrgContext) -> float:
+        """
+        Calculate eligibility match score (0-1) against a prepared organization context.
+        """
         if not grant_eligibility:
             return 1.0  # No eligibility requirements means everyone is eligible
             
-        # Common eligibility criteria to check
-        criteria_checkers = {
-            "501(c)(3)": lambda profile: profile.get("is_501c3", False),
-            "nonprofit": lambda profile: profile.get("is_nonprofit", False),
-            "years": self._check_years_requirement,
-            "budget": self._check_budget_requirement,
-            "location": self._check_location_requirement
-        }
-        
         # Track the number of criteria met
         criteria_met = 0
         criteria_total = 0
@@ -623,35 +1086,12 @@ class GrantScout(BaseAgent):
             requirement_lower = requirement.lower()
             criteria_total += 1
             
-            # Check for 501(c)(3) requirement
-            if any(term in requirement_lower for term in ["501(c)(3)", "501c3", "tax-exempt"]):
-                if criteria_checkers["501(c)(3)"](org_profile):
-                    criteria_met += 1
-                    
-            # Check for nonprofit status
-            elif any(term in requirement_lower for term in ["nonprofit", "non-profit", "not for profit"]):
-                if criteria_checkers["nonprofit"](org_profile):
-                    criteria_met += 1
-                    
-            # Check for years of operation
-            elif any(term in requirement_lower for term in ["years", "established", "history"]):
-                if self._check_years_requirement(requirement_lower, org_profile):
-                    criteria_met += 1
-                    
-            # Check for budget requirements
-            elif any(term in requirement_lower for term in ["budget", "revenue", "income"]):
-                if self._check_budget_requirement(requirement_lower, org_profile):
-                    criteria_met += 1
-                    
-            # Check for location requirements
-            elif any(term in requirement_lower for term in ["located", "location", "area", "region"]):
-                if self._check_location_requirement(requirement_lower, org_profile):
-                    criteria_met += 1
-                    
-            # Default assumption for other requirements
-            else:
+            category = _eligibility_category(requirement_lower)
+            if category is None:
                 # For requirements we can't automatically check, assume met
                 criteria_met += 0.5
+            elif self._criteria_checkers[category](requirement_lower, org_ctx):
+                criteria_met += 1
         
         # Calculate match score
         return criteria_met / criteria_total if criteria_total > 0 else 1.0
@@ -659,7 +1099,7 @@ class GrantScout(BaseAgent):
     def _check_years_requirement(self, requirement: str, org_profile: Dict[str, Any]) -> bool:
         """Check if organization meets years of operation requirement."""
         # Extract years number from requirement
-        years_match = re.search(r'(\d+)\s*years?', requirement)
+        years_match = _YEARS_RE.search(requirement)
         if not years_match:
             return True  # Can't determine requirement, assume met
             
@@ -671,7 +1111,7 @@ class GrantScout(BaseAgent):
     def _check_budget_requirement(self, requirement: str, org_profile: Dict[str, Any]) -> bool:
         """Check if organization meets budget requirement."""
         # Extract budget number from requirement
-        budget_match = re.search(r'budget\s*(under|over|at least|maximum|minimum)?\s*\$?(\d[\d,]*)', requirement)
+        budget_match = _BUDGET_RE.search(requirement)
         if not budget_match:
             return True  # Can't determine requirement, assume met
             
@@ -685,17 +1125,9 @@ class GrantScout(BaseAgent):
             return org_budget >= amount
     
     def _check_location_requirement(self, requirement: str, org_profile: Dict[str, Any]) -> bool:
-        """Check if organization meets location requirement."""
-        org_locations = org_profile.get("service_areas", [])
-        if not org_locations:
-            return False
-            
-        # Look for location mentions in the requirement
-        for location in org_locations:
-            if location.lower() in requirement:
-                return True
-                
-        return False
+        """Check if organization meets location requirement (the requirement is already lowercased)."""
+        org_locations = tuple(location.lower() for location in org_profile.get("service_areas") or ())
+        return _mentions_location(requirement, org_locations)
     
     def _calculate_funding_match(self, grant_amount: int, ideal_funding: Dict[str, Any]) -> float:
         """
@@ -703,51 +1135,47 @@ class GrantScout(BaseAgent):
         """
         if not grant_amount or not ideal_funding:
             return 0.5  # Neutral score if information is missing
+        
+        return _funding_match(grant_amount, *_funding_bounds(ideal_funding))
+    
+    def _calculate_funding_match_batch(self, grant_amounts: Sequence[Any], ideal_funding: Dict[str, Any]) -> np.ndarray:
+        """
+        Calculate funding amount match scores (0-1) for many grants at once.
+        
+        Each score is the same as _calculate_funding_match for that amount; the
+        three ranges are evaluated for every grant and selected with np.where.
+        """
+        amounts = np.array([amount or 0 for amount in grant_amounts], dtype=np.float64)
+        if not ideal_funding:
+            return np.full(len(amounts), 0.5)  # Neutral score if information is missing
             
-        min_amount = ideal_funding.get("min_amount", 0)
-        max_amount = ideal_funding.get("max_amount", float('inf'))
-        optimal_amount = ideal_funding.get("optimal_amount", (min_amount + max_amount) / 2 if max_amount != float('inf') else min_amount * 2)
-        
-        # Check if amount is within range
-        if grant_amount < min_amount:
-            # Below minimum - partial score based on how close it is
-            return max(0, grant_amount / min_amount * 0.5)
-        elif max_amount != float('inf') and grant_amount > max_amount:
-            # Above maximum - partial score based on how close it is
-            return max(0, 0.5 - (grant_amount - max_amount) / max_amount * 0.5)
+        min_amount, max_amount, optimal_amount = _funding_bounds(ideal_funding)
+        
+        # Within range - full score with bonus for being close to optimal
+        if optimal_amount:
+            proximity = 1 - np.minimum(np.abs(amounts - optimal_amount) / optimal_amount, 1)
+            scores = 0.7 + proximity * 0.3
         else:
-            # Within range - full score with bonus for being close to optimal
-            base_score = 0.7
-            if optimal_amount:
-                # Calculate how close to optimal (normalized to 0-0.3 range)
-                proximity = 1 - min(abs(grant_amount - optimal_amount) / optimal_amount, 1)
-                return base_score + proximity * 0.3
-            return base_score
+            scores = np.full(len(amounts), 0.7)
+        
+        # Ranges that don't apply to a grant may divide by zero; those results are discarded
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if max_amount is not None:
+                # Above maximum - partial score based on how close it is
+                scores = np.where(amounts > max_amount,
+                                  np.maximum(0, 0.5 - (amounts - max_amount) / max_amount * 0.5), scores)
+            # Below minimum - partial score based on how close it is (checked first by the scalar version)
+            scores = np.where(amounts < min_amount, np.maximum(0, amounts / min_amount * 0.5), scores)
+        
+        # Neutral score if the grant amount is missing
+        return np.where(amounts == 0, 0.5, scores)
     
     def _calculate_geography_match(self, grant_geography: List[str], org_service_areas: List[str]) -> float:
         """
         Calculate geographic match score (0-1).
         """
-        if not grant_geography or not org_service_areas:
-            return 0.5  # Neutral score if information is missing
-            
-        # Normalize geography strings
-        grant_geography = [g.lower() for g in grant_geography]
-# Normalize geography strings
-        grant_geography = [g.lower() for g in grant_geography]
-        org_service_areas = [a.lower() for a in org_service_areas]
-        
-        # Check for direct matches
-        direct_matches = 0
-        for grant_area in grant_geography:
-            for org_area in org_service_areas:
-                # Check for exact matches or if one contains the other
-                if grant_area == org_area or grant_area in org_area or org_area in grant_area:
-                    direct_matches += 1
-                    break
-        
-        # Calculate match ratio
-        return direct_matches / len(grant_geography) if grant_geography else 0.5
+        org_areas = tuple(a.lower() for a in org_service_areas or ())
+        return _geography_match(grant_geography, org_areas, dict.fromkeys(org_areas, True))
     
     def _calculate_timeline_match(self, grant_deadline: str, org_capacity: Dict[str, Any]) -> float:
         """
@@ -756,23 +1184,27 @@ class GrantScout(BaseAgent):
         if not grant_deadline or not org_capacity:
             return 0.5  # Neutral score if information is missing
             
-        # Try to parse deadline into a date
+        # Simple parsing for common date formats: a deadline split by '/' into
+        # three parts counts as a date if every part is a whole number. The
+        # split is kept from the original check so that strings like a/b/c
+        # still get the neutral score
         try:
-            # Simple parsing for common date formats
-            if '/' in grant_deadline:
-                parts = grant_deadline.split('/')
-                if len(parts) == 3:
-                    month, day, year = int(parts[0]), int(parts[1]), int(parts[2])
-                    # Would convert to date object in real implementation
-            
-            # Check available capacity periods
-            available_periods = org_capacity.get("available_periods", [])
-            for period in available_periods:
-                # Would implement period matching in real implementation
-                pass
-                
-            # For now, return a default medium-high score
-            return 0.7
-        except Exception:
-            # If we can't parse the deadline, return neutral score
+            if '/' in grant_deadline and _is_malformed_slash_date(grant_deadline):
+                return 0.5
+        except (TypeError, AttributeError):
+            # Deadline is not a string
             return 0.5
+        
+        # Capacity periods are not matched against the deadline yet, so for
+        # now return a default medium-high score
+        return 0.7
+
+
+async def _process_and_close(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Process one input with a fresh agent and close it before the event loop ends."""
+    async with GrantScout() as scout:
+        return await scout.process(input_data)
+
+def _process_in_worker(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run GrantScout.process for a single input inside a worker process."""
+    return asyncio.run(_process_and_close(input_data))
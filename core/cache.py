@@ -0,0 +1,50 @@
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+class TTLCache:
+    """
+    In-process cache-aside store whose entries expire after a per-entry TTL.
+
+    Values are deep-copied on the way in and out, so callers can mutate what
+    they get back (e.g. add match scores to grants) without touching the cache.
+    If maxsize is set, the least recently used entry is evicted once the cache
+    holds more than maxsize entries.
+    """
+    def __init__(self, maxsize: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        self._maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return a copy of the value stored under key, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, expire: float) -> None:
+        """
+        Store a copy of value under key for `expire` seconds.
+        """
+        self._entries[key] = (self._clock() + expire, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        if self._maxsize is not None and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,63 @@
+import pytest
+
+from core.cache import TTLCache
+
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+def test_get_missing():
+    """Test that a missing key returns None."""
+    assert TTLCache().get('missing') is None
+
+def test_entries_expire():
+    """Test that entries are served until their TTL runs out."""
+    clock = FakeClock()
+    cache = TTLCache(clock=clock)
+    cache.set('short', 1, expire=10)
+    cache.set('long', 2, expire=100)
+    
+    clock.now = 9.9
+    assert cache.get('short') == 1
+    
+    clock.now = 10
+    assert cache.get('short') is None
+    assert cache.get('long') == 2
+    assert len(cache) == 1
+
+def test_values_are_copied():
+    """Test that mutating stored or returned values does not change the cache."""
+    cache = TTLCache()
+    grants = [{'title': 'Grant', 'focus_areas': ['health']}]
+    cache.set('grants', grants, expire=60)
+    grants[0]['focus_areas'].append('education')
+    
+    cached = cache.get('grants')
+    assert cached == [{'title': 'Grant', 'focus_areas': ['health']}]
+    cached[0]['match_score'] = 50
+    assert cache.get('grants') == [{'title': 'Grant', 'focus_areas': ['health']}]
+
+def test_maxsize_evicts_least_recently_used():
+    """Test that a full cache drops the entry used longest ago."""
+    cache = TTLCache(maxsize=2)
+    cache.set('a', 1, expire=60)
+    cache.set('b', 2, expire=60)
+    assert cache.get('a') == 1
+    cache.set('c', 3, expire=60)
+    
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+
+def test_clear():
+    """Test that clear drops every entry."""
+    cache = TTLCache()
+    cache.set('key', 'value', expire=60)
+    cache.clear()
+    assert cache.get('key') is None
+    assert len(cache) == 0
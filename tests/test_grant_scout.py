@@ -2,6 +2,7 @@ import pytest
 import os
 from pathlib import Path
 import asyncio
+import threading
 
 from agents.grant_scout import GrantScout
 
@@ -16,6 +17,9 @@ def grant_scout():
 @pytest.fixture
 def sample_rfp_text():
     """Load sample RFP text content."""
+    # Read with plain text-mode open rather than mmap: tests pass this as
+    # `content`, and it is the independent oracle for the mmap-backed
+    # GrantScout._iter_text_chunks used for file input
     sample_path = SAMPLE_DIR / "sample_rfp.txt"
     with open(sample_path, 'r', encoding='utf-8') as f:
         return f.read()
@@ -60,10 +64,174 @@ async def test_process_with_content(grant_scout, sample_rfp_text):
     assert len(result["requirements"]) > 0
 
 @pytest.mark.asyncio
-async def test_analyze_document(grant_scout, sample_rfp_text):
+async def test_process_analyzes_off_event_loop(grant_scout, sample_rfp_text, tmp_path):
+    """Test that file reads and analysis run outside the event loop thread."""
+    test_file = tmp_path / "test_rfp.txt"
+    test_file.write_text(sample_rfp_text, encoding='utf-8')
+    threads = []
+    analyze_input = grant_scout._analyze_input
+    
+    def record_thread(input_data):
+        threads.append(threading.get_ident())
+        return analyze_input(input_data)
+    
+    grant_scout._analyze_input = record_thread
+    results = await asyncio.gather(*(grant_scout.process({"file_path": str(test_file)}) for _ in range(3)))
+    
+    assert threads and threading.get_ident() not in threads
+    assert all(result == results[0] for result in results)
+    assert results[0]["requirements"] == grant_scout._analyze_document(sample_rfp_text).requirements
+
+def test_analyze_document(grant_scout, sample_rfp_text):
     """Test document analysis functionality."""
-    result = await grant_scout._analyze_document(sample_rfp_text)
+    result = grant_scout._analyze_document(sample_rfp_text)
     
-    assert "requirements" in result
     # Our sample contains several requirements patterns
-    assert len(result["requirements"]) > 0
+    assert len(result.requirements) > 0
+
+def test_analyze_document_streamed_chunks(grant_scout, sample_rfp_text):
+    """Test that analyzing a streamed file matches analyzing the whole text."""
+    whole = grant_scout._analyze_document(sample_rfp_text)
+    
+    # Tiny chunks force sentences to straddle chunk boundaries
+    chunks = grant_scout._iter_text_chunks(SAMPLE_DIR / "sample_rfp.txt", chunk_size=7)
+    streamed = grant_scout._analyze_document(chunks)
+    
+    assert streamed == whole
+
+def test_process_batch(grant_scout, sample_rfp_text):
+    """Test that batch processing returns one result per input, in order."""
+    inputs = [{"content": sample_rfp_text}, {}, {"content": "Applicants must apply early."}]
+    results = grant_scout.process_batch(inputs, max_workers=2)
+    
+    assert len(results) == 3
+    assert results[0]["success"] == True
+    assert len(results[0]["requirements"]) > 0
+    assert results[1]["success"] == False
+    assert results[2]["requirements"] == ["Applicants must apply early"]
+
+def test_analyze_document_preserves_case(grant_scout):
+    """Test that matching is case-insensitive but results keep original casing."""
+    result = grant_scout._analyze_document("APPLICANTS MUST Be Local. DEADLINE: May 1")
+    assert result.requirements == ["APPLICANTS MUST Be Local"]
+    assert result.deadlines == ["DEADLINE: May 1"]
+    
+    # U+0130 lowercases to two characters, which exercises the fallback path
+    result = grant_scout._analyze_document("İstanbul applicants MUST Be Local.")
+    assert result.requirements == ["applicants MUST Be Local"]
+
+def test_analyze_document_cached(grant_scout, sample_rfp_text):
+    """Test that repeated analysis of the same text is served from the cache."""
+    first = grant_scout._analyze_document(sample_rfp_text)
+    first.requirements.append("modified by caller")
+    
+    second = GrantScout()._analyze_document(sample_rfp_text)
+    assert "modified by caller" not in second.requirements
+    assert second.requirements == first.requirements[:-1]
+
+def test_analyze_document_limits(grant_scout):
+    """Test that each section stops at its limit."""
+    text = " ".join(f"Item {i} must be included. Deadline: day {i}." for i in range(20))
+    result = grant_scout._analyze_document(text)
+    
+    assert len(result.requirements) == 10
+    assert result.requirements[0] == "must be included"
+    assert result.deadlines == ["Deadline: day 0", "Deadline: day 1", "Deadline: day 2"]
+
+def test_analyze_document_sections_of_interest(grant_scout, sample_rfp_text):
+    """Test that only the requested sections are extracted."""
+    full = grant_scout._analyze_document(sample_rfp_text)
+    result = grant_scout._analyze_document(sample_rfp_text, ["deadlines"])
+    
+    assert result.deadlines == full.deadlines
+    assert result.requirements == result.eligibility == result.scoring_criteria == []
+
+def test_analyze_document_empty_sections_of_interest(grant_scout, sample_rfp_text):
+    """Test that an empty sections_of_interest extracts every section."""
+    assert grant_scout._analyze_document(sample_rfp_text, []) == grant_scout._analyze_document(sample_rfp_text)
+
+def test_analyze_document_stops_reading_when_full(grant_scout):
+    """Test that a streamed document is only read until the requested sections are full."""
+    def chunks():
+        for i in range(10):
+            yield f"Applicants must provide item {i}. "
+        raise AssertionError("read past the last needed chunk")
+    
+    result = grant_scout._analyze_document(chunks(), ["requirements"])
+    assert len(result.requirements) == 10
+
+@pytest.mark.parametrize("text", [
+    "must " * 200000,
+    "must ." * 200000,
+    "eligible applicants" + " :" * 200000 + ".",
+    ("deadline:" + " " * 50 + "\n") * 20000,
+    " " * 1000000
+])
+def test_analyze_document_adversarial_input(grant_scout, text):
+    """Test that inputs built to provoke regex backtracking are scanned in linear time."""
+    result = grant_scout._analyze_document(text)
+    assert len(result.requirements) <= 1
+    assert len(result.deadlines) <= 3
+
+def test_iter_text_chunks_matches_text_mode(tmp_path):
+    """Test that chunked reads decode split characters and newlines like open()."""
+    test_file = tmp_path / "test_rfp.txt"
+    test_file.write_bytes("Applicants must résumé.\r\nDeadline: 1 €\r\n".encode("utf-8") * 10)
+    
+    with open(test_file, 'r', encoding='utf-8') as f:
+        expected = f.read()
+    for chunk_size in (1, 2, 3, 5):
+        assert "".join(GrantScout._iter_text_chunks(test_file, chunk_size)) == expected
+
+@pytest.mark.asyncio
+async def test_process_pdf(grant_scout):
+    """Test processing an RFP supplied as a PDF file."""
+    result = await grant_scout.process({"file_path": str(SAMPLE_DIR / "sample_rfp.pdf")})
+    
+    assert result["success"] == True
+    assert "Applicants must demonstrate a track record of success in health service delivery" in result["requirements"]
+    assert "Deadline: October 30, 2025" in result["deadlines"]
+
+@pytest.mark.asyncio
+async def test_process_pdf_concurrently(grant_scout):
+    """Test that concurrent PDF analyses, run in worker threads, all get the same result."""
+    input_data = {"file_path": str(SAMPLE_DIR / "sample_rfp.pdf")}
+    expected = await grant_scout.process(input_data)
+    results = await asyncio.gather(*(GrantScout().process(input_data) for _ in range(8)))
+    
+    assert expected["success"] == True
+    assert all(result == expected for result in results)
+
+@pytest.mark.asyncio
+async def test_process_docx(grant_scout, sample_rfp_text, tmp_path):
+    """Test processing an RFP supplied as a DOCX file."""
+    import docx
+    document = docx.Document()
+    for line in sample_rfp_text.splitlines():
+        document.add_paragraph(line)
+    test_file = tmp_path / "test_rfp.docx"
+    document.save(str(test_file))
+    
+    result = await grant_scout.process({"file_path": str(test_file)})
+    expected = grant_scout._analyze_document(sample_rfp_text)
+    
+    assert result["success"] == True
+    assert result["requirements"] == expected.requirements
+    assert result["deadlines"] == expected.deadlines
+
+def test_extract_pdf_skips_pages_without_text(grant_scout):
+    """Test that graphics-only PDF pages produce no text chunk."""
+    # The sample's second page only contains a filled rectangle
+    pages = list(grant_scout._extract_pdf(SAMPLE_DIR / "sample_rfp.pdf"))
+    assert len(pages) == 2
+    assert all(page.strip() for page in pages)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("suffix", [".txt", ".pdf", ".docx"])
+async def test_process_missing_file(grant_scout, tmp_path, suffix):
+    """Test that a missing file is reported as a structured error."""
+    missing = tmp_path / f"missing{suffix}"
+    result = await grant_scout.process({"file_path": str(missing)})
+    
+    assert result["success"] == False
+    assert result["error"] == f"File not found: {missing}"
@@ -1,8 +1,391 @@
 import pytest
-from agents.grant_scout import GrantScout
+import pytest_asyncio
+import asyncio
+import re
+import logging
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from bs4 import BeautifulSoup
+
+from agents.grant_scout import GrantScout, _eligibility_category, _geography_match, _is_malformed_slash_date, _mentions_location
 
 def test_init():
     """Test GrantScout initialization."""
     agent = GrantScout()
     assert agent.name == "GrantScout"
     assert agent.description == "Analyzes RFPs and finds grant opportunities matching organization profiles"
+
+SAMPLE_GRANT_HTML = """
+<html><head>
+<meta property="og:site_name" content="Example Foundation">
+<meta name="description" content="Funding for community health programs.">
+</head><body>
+<h1>Community Health Grant</h1>
+<p>Awards of up to $125,000.50 are available. A second tier offers $10,000.</p>
+<h2>Eligibility</h2>
+<ul><li>Must be a 501(c)(3) nonprofit</li><li>At least 3 years of operation</li></ul>
+<h2>How to Apply</h2>
+<p>Submit a letter of intent.</p>
+<h3>Focus Areas</h3>
+<p>health, education, youth</p>
+<p>Application deadline: 10/30/2025</p>
+</body></html>
+"""
+
+@pytest.fixture
+def grant_scout():
+    """Create a GrantScout instance for testing."""
+    return GrantScout()
+
+@pytest.fixture
+def grant_soup():
+    """Parse the sample grant page."""
+    return BeautifulSoup(SAMPLE_GRANT_HTML, 'lxml')
+
+def test_extract_grant_page_fields(grant_scout, grant_soup):
+    """Test field extraction from a grant page."""
+    assert grant_scout._extract_funder(grant_soup) == "Example Foundation"
+    assert grant_scout._extract_description(grant_soup) == "Funding for community health programs."
+    assert grant_scout._extract_amount(grant_soup) == 125000
+    assert grant_scout._extract_amount(grant_soup, "Awards of $12,500.75 to $50,000") == 12500
+    assert grant_scout._extract_amount(grant_soup, "Up to $9,007,199,254,740,993 available") == 9007199254740993
+    assert grant_scout._extract_amount(grant_soup, "No amount listed") == 0
+    assert grant_scout._extract_deadline(grant_soup) == "10/30/2025"
+    page_text = grant_soup.get_text()
+    assert grant_scout._extract_deadline(grant_soup, page_text) == "10/30/2025"
+    assert grant_scout._extract_deadline(grant_soup, text_lower=page_text.lower()) == "10/30/2025"
+    assert grant_scout._extract_eligibility(grant_soup) == [
+        "Must be a 501(c)(3) nonprofit", "At least 3 years of operation"]
+    assert grant_scout._extract_requirements(grant_soup) == ["Submit a letter of intent."]
+    assert grant_scout._extract_focus_areas(grant_soup) == ["health", "education", "youth"]
+
+def test_extract_meta_fields_with_html(grant_scout, grant_soup):
+    """Test that the raw html check finds meta tags and skips pages without them."""
+    assert grant_scout._extract_funder(grant_soup, SAMPLE_GRANT_HTML) == "Example Foundation"
+    assert grant_scout._extract_description(grant_soup, SAMPLE_GRANT_HTML) == "Funding for community health programs."
+    
+    html = re.sub(r'<meta[^>]*>', '', SAMPLE_GRANT_HTML)
+    soup = BeautifulSoup(html, 'lxml')
+    assert grant_scout._extract_funder(soup, html) == "Unknown Funder"
+    assert grant_scout._extract_description(soup, html) == grant_scout._extract_description(soup)
+    
+    # A '>' inside an earlier quoted attribute does not hide the tag
+    html = '<html><head><meta content="Ages 5 > 10" property="og:site_name"></head></html>'
+    assert grant_scout._extract_funder(BeautifulSoup(html, 'lxml'), html) == "Ages 5 > 10"
+
+def test_extract_sections_case_insensitive_headings(grant_scout):
+    """Test headings whose case-insensitive keyword match does not lowercase to the keyword."""
+    soup = BeautifulSoup(
+        "<h2>Focus Area\u017f</h2><p>health, youth</p>"
+        "<h2>EL\u0130GIBILITY</h2><ul><li>Nonprofits</li></ul>", 'lxml')
+    sections = grant_scout._extract_sections(soup)
+    assert sections['focus_areas'] == ["health", "youth"]
+    assert sections['eligibility'] == ["Nonprofits"]
+
+def test_eligibility_requirement_checks(grant_scout):
+    """Test the years, budget and location eligibility checks."""
+    profile = {"years_of_operation": 5, "annual_budget": 400000}
+    assert grant_scout._check_years_requirement("at least 3 years of operation", profile)
+    assert not grant_scout._check_years_requirement("at least 10 years of operation", profile)
+    assert grant_scout._check_budget_requirement("budget under $500,000", profile)
+    assert not grant_scout._check_budget_requirement("budget at least $1,000,000", profile)
+    profile = {"service_areas": ["Vermont", "New Hampshire"]}
+    assert grant_scout._check_location_requirement("must serve vermont residents", profile)
+    assert not grant_scout._check_location_requirement("must serve maine residents", profile)
+    assert not grant_scout._check_location_requirement("must serve vermont residents", {})
+
+SAMPLE_CANDID_RESPONSE = {
+    'grants': [
+        {
+            'title': "Youth Education Fund",
+            'funder': {'name': "Example Foundation"},
+            'amount': {'amount': 50000},
+            'application_deadline': "2025-11-15",
+            'subject_areas': ["education", "youth"],
+            'geography': ["Vermont"]
+        }
+    ]
+}
+
+@pytest_asyncio.fixture
+async def grant_server():
+    """Serve the sample grant page from a local HTTP server."""
+    async def grant_page(request):
+        return web.Response(text=SAMPLE_GRANT_HTML, content_type='text/html')
+    
+    async def candid_grants(request):
+        if request.query.get('key') != 'test-key':
+            return web.Response(status=401, text="Invalid API key")
+        return web.json_response(SAMPLE_CANDID_RESPONSE)
+    
+    app = web.Application()
+    app.router.add_get('/grant', grant_page)
+    app.router.add_get('/v1/grants', candid_grants)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+@pytest.mark.asyncio
+async def test_analyze_grant_url(grant_scout, grant_server):
+    """Test analyzing a grant page fetched over HTTP."""
+    url = str(grant_server.make_url('/grant'))
+    try:
+        grants = await grant_scout._analyze_grant_url(url)
+        session = grant_scout._session
+        # A second fetch reuses the agent's session
+        assert await grant_scout._analyze_grant_url(url) == grants
+        assert grant_scout._session is session
+    finally:
+        await grant_scout.aclose()
+    assert session.closed
+    
+    assert len(grants) == 1
+    grant = grants[0]
+    assert grant['title'] == "Community Health Grant"
+    assert grant['funder'] == "Example Foundation"
+    assert grant['amount'] == 125000
+    assert grant['deadline'] == "10/30/2025"
+    assert grant['eligibility'] == ["Must be a 501(c)(3) nonprofit", "At least 3 years of operation"]
+    assert grant['requirements'] == ["Submit a letter of intent."]
+    assert grant['focus_areas'] == ["health", "education", "youth"]
+    assert grant['source'] == 'direct_url'
+
+def test_search_grants_across_event_loops(grant_scout):
+    """Test that an agent reused across asyncio.run calls closes its session before each loop ends."""
+    async def grant_page(request):
+        return web.Response(text=SAMPLE_GRANT_HTML, content_type='text/html')
+    
+    sessions = []
+    get_session = grant_scout._get_session
+    
+    async def record_session():
+        session = await get_session()
+        if session not in sessions:
+            sessions.append(session)
+        return session
+    
+    async def search_once():
+        app = web.Application()
+        app.router.add_get('/grant', grant_page)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            result = await grant_scout.search_grants({'url': str(server.make_url('/grant'))})
+            # Closed on the loop that opened it, before asyncio.run drops that loop
+            assert sessions[-1].closed
+            return result
+        finally:
+            await server.close()
+    
+    grant_scout._get_session = record_session
+    results = [asyncio.run(search_once()) for _ in range(3)]
+    
+    assert [result['grants_found'] for result in results] == [1, 1, 1]
+    assert len(sessions) == 3
+    assert grant_scout._session is None and grant_scout._session_loop is None
+
+@pytest.mark.asyncio
+async def test_search_grants_in_context(grant_scout, grant_server):
+    """Test that searches inside `async with` share one session, closed on exit."""
+    criteria = {'url': str(grant_server.make_url('/grant'))}
+    async with grant_scout as scout:
+        await scout.search_grants(criteria)
+        session = scout._session
+        await scout.search_grants(criteria)
+        assert scout._session is session and not session.closed
+    
+    assert session.closed
+    assert grant_scout._session is None
+
+@pytest.mark.asyncio
+async def test_search_grants_multiple_urls(grant_scout, grant_server):
+    """Test that every URL is analyzed and results keep the input order."""
+    urls = [str(grant_server.make_url('/grant')), str(grant_server.make_url('/missing')), str(grant_server.make_url('/grant'))]
+    try:
+        result = await grant_scout.search_grants({'url': urls})
+    finally:
+        await grant_scout.aclose()
+    
+    assert result['success']
+    assert result['grants_found'] == 2
+    assert [grant['url'] for grant in result['results']] == [urls[0], urls[2]]
+
+@pytest.mark.asyncio
+async def test_analyze_grant_url_cached(grant_scout, grant_server):
+    """Test that a grant page is only fetched once while cached."""
+    url = str(grant_server.make_url('/grant'))
+    try:
+        grants = await grant_scout._analyze_grant_url(url)
+        grants[0]['match_score'] = 80
+        await grant_server.close()
+        # Served from the cache even though the server is gone, without the caller's changes
+        cached = await grant_scout._analyze_grant_url(url)
+    finally:
+        await grant_scout.aclose()
+    
+    assert 'match_score' not in cached[0]
+    assert cached[0]['title'] == "Community Health Grant"
+
+SAMPLE_ORG_PROFILE = {
+    'mission_statement': "We improve community health and youth education in rural Vermont.",
+    'focus_areas': ["Public Health", "Education", "Youth Development"],
+    'is_501c3': True,
+    'is_nonprofit': True,
+    'years_of_operation': 5,
+    'annual_budget': 750000,
+    'service_areas': ["Vermont", "New Hampshire"],
+    'ideal_funding': {'min_amount': 25000, 'max_amount': 200000},
+    'capacity': {'available_periods': ["Q1", "Q3"]}
+}
+
+SAMPLE_GRANTS = [
+    {
+        'title': "Rural Health Access",
+        'focus_areas': ["health", "Rural Communities"],
+        'eligibility': ["Must be a 501(c)(3) nonprofit", "At least 3 years of operation", "Organizations located in Vermont"],
+        'amount': 125000,
+        'geography': ["Vermont"],
+        'deadline': "10/30/2025"
+    },
+    {
+        'title': "Arts Access",
+        'focus_areas': ["Arts", "Culture"],
+        'eligibility': ["Annual budget under $500,000", "Established 10 years"],
+        'amount': 10000,
+        'geography': ["California", "Oregon"],
+        'deadline': "March 1, 2026"
+    },
+    {
+        'title': "Regional Education",
+        'focus_areas': ["Education", "youth"],
+        'eligibility': ["Non-profit organizations in the New England region", "Applicants must submit audited financials"],
+        'amount': 400000,
+        'geography': ["New England", "new hampshire"],
+        'deadline': ""
+    },
+    {
+        'title': "Unscoped",
+        'focus_areas': [],
+        'eligibility': [],
+        'amount': 0,
+        'geography': []
+    }
+]
+
+EXPECTED_MATCH_SCORES = [81, 11, 61, 48]
+
+def test_calculate_match_score(grant_scout):
+    """Test match scores for grants that exercise each scoring component."""
+    scores = [grant_scout.calculate_match_score(grant, SAMPLE_ORG_PROFILE) for grant in SAMPLE_GRANTS]
+    assert scores == EXPECTED_MATCH_SCORES
+    assert grant_scout.calculate_match_score(SAMPLE_GRANTS[0], {}) == 0
+
+def test_score_grants_batch(grant_scout):
+    """Test that batch scoring matches scoring each grant on its own."""
+    assert grant_scout.score_grants_batch(SAMPLE_GRANTS, SAMPLE_ORG_PROFILE) == EXPECTED_MATCH_SCORES
+    assert grant_scout.score_grants_batch([], SAMPLE_ORG_PROFILE) == []
+    assert grant_scout.score_grants_batch(SAMPLE_GRANTS, {}) == [0, 0, 0, 0]
+
+@pytest.mark.parametrize("requirement, category", [
+    ("must be a 501(c)(3) nonprofit", "501(c)(3)"),
+    ("tax-exempt status in the region", "501(c)(3)"),
+    ("non-profit with 5 years of history", "nonprofit"),
+    ("established 10 years ago", "years"),
+    ("revenue over $1m in the area", "budget"),
+    ("organizations located in vermont", "location"),
+    ("submit audited financials", None)
+])
+def test_eligibility_category(requirement, category):
+    """Test that requirements fall in the highest-priority category they mention."""
+    assert _eligibility_category(requirement) == category
+
+@pytest.mark.asyncio
+async def test_search_candid_api(grant_scout, grant_server, caplog):
+    """Test converting a Candid API response to the standard grant format."""
+    grant_scout._CANDID_API_URL = str(grant_server.make_url('/v1/grants'))
+    try:
+        grants = await grant_scout._search_candid_api({'api_key': 'test-key', 'keywords': ["youth"]})
+        with caplog.at_level(logging.ERROR, logger='agents.grant_scout'):
+            rejected = await grant_scout._search_candid_api({'api_key': 'wrong-key'})
+    finally:
+        await grant_scout.aclose()
+    
+    assert "Candid API error: 401 - Invalid API key" in caplog.text
+    
+    assert grants == [{
+        'title': "Youth Education Fund",
+        'funder': "Example Foundation",
+        'amount': 50000,
+        'deadline': "2025-11-15",
+        'description': '',
+        'url': '',
+        'eligibility': [],
+        'requirements': [],
+        'focus_areas': ["education", "youth"],
+        'geography': ["Vermont"],
+        'source': 'candid_api'
+    }]
+    assert rejected == []
+
+@pytest.mark.parametrize("field", ["mission_statement", "focus_areas", "service_areas", "ideal_funding", "capacity"])
+def test_match_score_null_profile_fields(grant_scout, field):
+    """Test that a null profile field (JSON null) scores like a missing one."""
+    missing = {key: value for key, value in SAMPLE_ORG_PROFILE.items() if key != field}
+    null = dict(SAMPLE_ORG_PROFILE, **{field: None})
+    expected = [grant_scout.calculate_match_score(grant, missing) for grant in SAMPLE_GRANTS]
+    
+    assert [grant_scout.calculate_match_score(grant, null) for grant in SAMPLE_GRANTS] == expected
+    assert grant_scout.score_grants_batch(SAMPLE_GRANTS, null) == expected
+
+@pytest.mark.parametrize("ideal_funding", [
+    {},
+    {'min_amount': 25000, 'max_amount': 200000},
+    {'min_amount': 25000},
+    {'max_amount': 200000},
+    {'min_amount': 1000, 'max_amount': 5000, 'optimal_amount': 0},
+    {'min_amount': 25000, 'max_amount': 200000, 'optimal_amount': 150000}
+])
+def test_funding_match_batch(grant_scout, ideal_funding):
+    """Test that batch funding scores equal the per-grant scores."""
+    amounts = [0, None, 999, 1000, 24999, 25000, 112500, 150000, 200000, 200001, 400000, 10000000]
+    expected = [grant_scout._calculate_funding_match(amount, ideal_funding) for amount in amounts]
+    assert grant_scout._calculate_funding_match_batch(amounts, ideal_funding).tolist() == expected
+
+def test_geography_match_shared_across_grants(grant_scout):
+    """Test geography scores when one set of memoized area matches is shared by several grants."""
+    service_areas = ["Vermont", "New England"]
+    geographies = [["VERMONT"], ["Vermont", "Oregon"], ["Greater New England", "vermont"], ["Oregon"], []]
+    area_matches = dict.fromkeys(("vermont", "new england"), True)
+    scores = [_geography_match(geography, ("vermont", "new england"), area_matches)
+              for geography in geographies]
+    assert scores == [1.0, 0.5, 1.0, 0.0, 0.5]
+    assert scores == [grant_scout._calculate_geography_match(geography, service_areas) for geography in geographies]
+
+@pytest.mark.parametrize("deadline, expected", [
+    ("11/15/2025", 0.7),
+    ("2025/11/15", 0.7),
+    ("15/11/2025", 0.7),
+    ("13/45/2025", 0.7),
+    ("1/2/5", 0.7),
+    (" 1/ 2/2025", 0.7),
+    ("1/2", 0.7),
+    ("March 1, 2026", 0.7),
+    ("a/b/2025", 0.5),
+    ("a/b/c", 0.5),
+    ("2025-11-15", 0.7),
+    ("1/2/2025/", 0.7),
+    ("", 0.5),
+])
+def test_timeline_match(grant_scout, deadline, expected):
+    """Test that any three whole-number parts split by '/' count as a date."""
+    assert grant_scout._calculate_timeline_match(deadline, {"staff": 3}) == expected
+
+def test_clear_caches(grant_scout):
+    """Test that clearing the caches drops the memoized scoring lookups."""
+    grant_scout.score_grants_batch(SAMPLE_GRANTS, SAMPLE_ORG_PROFILE)
+    assert _is_malformed_slash_date.cache_info().currsize > 0
+    grant_scout.clear_caches()
+    assert _is_malformed_slash_date.cache_info().currsize == 0
+    assert _mentions_location.cache_info().currsize == 0
+    assert grant_scout.score_grants_batch(SAMPLE_GRANTS, SAMPLE_ORG_PROFILE) == EXPECTED_MATCH_SCORES